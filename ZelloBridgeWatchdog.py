@@ -1,225 +1,470 @@
-import json
-import os
-import time
-import requests
-import logging
-from datetime import datetime
-
-# These libraries are required to securely generate a JWT token.
-# To use this script, you must install them by running:
-# 'pip install PyJWT cryptography' in your terminal. 
-from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.primitives.asymmetric import rsa
-from cryptography.hazmat.backends import default_backend
-import jwt
-
-
-# Configure the logging module to output to the console with a specific format
-logging.basicConfig(
-    level=logging.INFO,
-    format='[%(asctime)s] %(levelname)s: %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
-
-# Define the URL of the endpoint
-url_endpoint = "http://127.0.0.1:8810"
-
-def generate_jwt_token(issuer_path, private_key_path):
-    """
-    Generates a secure JWT token.
-    
-    This function reads a private key and an issuer ID from specified files,
-    creates a JWT payload, and signs the token using the RS256 algorithm.
-    
-    Args:
-        issuer_path (str): The file path to the issuer ID.
-        private_key_path (str): The file path to the private key used for signing.
-
-    Returns:
-        str: A newly generated JWT token, or None if a required file is missing
-             or if an error occurs during token creation.
-    """
-    # Verify that the required key and issuer files exist before proceeding.
-    if not os.path.exists(private_key_path):
-        logging.error(f"Private key file not found at '{private_key_path}'")
-        return None
-    if not os.path.exists(issuer_path):
-        logging.error(f"Issuer file not found at '{issuer_path}'")
-        return None
-
-    # Safely read the content of the private key and issuer files.
-    try:
-        # Load the private key from a text file for use in signing.
-        with open(private_key_path, "r") as key_file:
-            private_key = serialization.load_pem_private_key(
-                key_file.read().encode(),
-                password=None,
-                backend=default_backend()
-            )
-        
-        # Read the issuer ID, which is a simple string in a text file.
-        with open(issuer_path, "r") as issuer_file:
-            issuer_content = issuer_file.read().strip()
-    except Exception as e:
-        logging.error(f"Failed to read key or issuer file: {e}")
-        return None
-    
-    # Define the JWT header and payload as per the required specification.
-    header = {"typ": "JWT", "alg": "RS256"}
-    payload = {
-        "iss": issuer_content,
-        "exp": round(time.time() + 120) #New token is valid for 2 minutes
-    }
-    
-    # Sign the token using the private key and defined algorithm.
-    try:
-        token = jwt.encode(payload, private_key, algorithm="RS256", headers=header)
-        logging.info("Successfully generated a new token.")
-        return token
-    except Exception as e:
-        logging.error(f"An error occurred while generating the JWT: {e}")
-        return None
-
-def update_connector_tokens(file_path):
-    """
-    This is the main function that reads the configuration file, finds the
-    relevant connectors, and updates their tokens.
-    
-    Args:
-        file_path (str): The path to the JSON configuration file to process.
-    """
-    # Check if the configuration file exists before attempting to open it.
-    if not os.path.exists(file_path):
-        logging.error(f"The file '{file_path}' was not found.")
-        return
-
-    # Read the JSON configuration data from the file.
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-    except (json.JSONDecodeError, IOError) as e:
-        logging.error(f"Error reading the file: {e}")
-        return
-
-    changes_made = False
-
-    # Check for the expected JSON structure with a 'links' key.
-    if isinstance(data, dict) and 'links' in data and isinstance(data['links'], list):
-        # The base directory is used to locate the key and issuer files.
-        base_dir = os.path.dirname(file_path)
-        
-        # Iterate through the links and their connectors to find the correct ones.
-        for link in data['links']:
-            if 'connectors' in link and isinstance(link['connectors'], list):
-                for connector in link['connectors']:
-                    # Look for connectors of type 'zello-channel-api' to update.
-                    if connector.get('type') == 'zello-channel-api':
-                        username = connector.get('username')
-                        if not username:
-                            logging.warning("Found 'zello-channel-api' connector without a 'username'. Skipping.")
-                            continue
-
-                        # Construct the file path for the private key based on the username.
-                        private_key_file = f"{username}.pem"
-                        private_key_path = os.path.join(base_dir, private_key_file)
-                        
-                        # Construct the file path for the issuer based on the username.
-                        issuer_file_name = f"{username}.txt"
-                        issuer_path = os.path.join(base_dir, issuer_file_name)
-                        
-                        # Call the token generation function.
-                        new_token = generate_jwt_token(issuer_path, private_key_path)
-                        
-                        # If a token was successfully generated, update the connector data.
-                        if new_token:
-                            connector['token'] = new_token
-                            logging.info(f"Successfully generated and assigned token for connector: {connector.get('name', 'N/A')}")
-                            changes_made = True
-                        else:
-                            logging.error(f"Could not generate a token for connector: {connector.get('name', 'N/A')}")
-    else:
-        logging.error("The JSON structure is not as expected. Check for a top-level 'links' key.")
-        return
-
-    # If changes were made, save the modified data back to the file.
-    if changes_made:
-        try:
-            with open(file_path, 'w') as f:
-                json.dump(data, f, indent=4)
-            logging.info(f"Successfully updated tokens and saved the file: {file_path}")
-        except Exception as e:
-            logging.error(f"An error occurred while writing to the file: {e}")
-            logging.error("Please check file permissions and try again.")
-    else:
-        logging.info("No tokens were generated. The file was not modified.")
-
-
-def main():
-    # Use a while loop to run the script indefinitely
-
-    # Create a requests Session object for connection pooling.
-    session = requests.Session()
-    
-    while True:
-        try:
-            # Send a GET request to the URL
-            response = session.get(url_endpoint+'/status', timeout=5)
-
-            # Check if the request was successful (status code 200)
-            if response.status_code == 200:
-                # The response is in JSON format, so we can parse it directly
-                data = response.json()
-
-                config_path = data.get("config_file")
- 
-                # --- Functionality to check for specific error code ---
-                found_error = False
-
-                # Safely iterate through the links in the response
-                for link in data.get("links", []):
-                    # Safely iterate through the connectors in each link
-                    for connector in link.get("connectors", []):
-                        # Check if the connector is of the specified type
-                        if connector.get('type') == 'zello-channel-api':
-                            # Access the nested 'last_error' dictionary and its 'code'
-                            error_code = connector.get('last_error', {}).get('code')
-                            logging.info(f"Connector '{connector.get('name', 'N/A')}' error code is {error_code}.")
-
-                            # Check if the error code matches 3001 or 3002
-                            if error_code in (3001, 3002):
-                                found_error = True
-
-                if found_error:
-                    logging.info("Connection error found. Generating new tokens...")
-                    update_connector_tokens(config_path)
-
-                    logging.info("Restarting ZelloBridge")
-                    try:
-                        # Send a PUT request to the restart endpoint
-                        restart_response = session.put(url_endpoint+'/restart', timeout=5)
-                        logging.info(f"Restart request sent. Status code: {restart_response.status_code}")
-                    except requests.exceptions.RequestException as e:
-                        logging.error(f"Failed to send restart request: {e}")
-
-                    # Wait for 1 minute so the Bridge has time to initialize
-                    logging.info("Sleep for 1 minute\n")
-                    time.sleep(60)                                
-
-            else:
-                # If the status code is not 200, print the status code and a message
-                logging.error(f"Request failed with status code: {response.status_code}")
-                logging.error(f"Response content: {response.text}")
-
-        except requests.exceptions.RequestException as e:
-            # This block handles any errors that might occur during the request,
-            # such as a connection timeout or the server being down.
-            logging.error(f"An error occurred: {e}")
-
-        # Wait for 1 second before the next iteration
-        time.sleep(1)    
-
-
-# This is the entry point of the script, which calls the main function.
-if __name__ == '__main__':
-    main()
-
+import asyncio
+import mmap
+import os
+import time
+import aiohttp
+import ijson
+import jmespath
+import orjson
+import logging
+
+import base64
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+# These libraries are required to talk to the bridge and to securely
+# generate a JWT token. To use this script, you must install them by running:
+# 'pip install aiohttp ijson jmespath orjson cryptography' in your terminal.
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import padding
+
+
+# Configure the logging module to output to the console with a specific format
+logging.basicConfig(
+    level=logging.INFO,
+    format='[%(asctime)s] %(levelname)s: %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+# Module-level logger; the %-style arguments below are only formatted when
+# the record actually passes the level filter.
+log = logging.getLogger(__name__)
+
+# Define the URL of the endpoint
+url_endpoint = "http://127.0.0.1:8810"
+
+# Compiled once at import time; selects every 'zello-channel-api' connector
+# across all links in a single pass.
+_ZELLO_CONNECTORS = jmespath.compile("links[].connectors[?type=='zello-channel-api'][]")
+
+# Projects only the fields the polling loop needs, so the hot path does no
+# per-connector dict navigation in Python. Missing fields come back as None.
+_ZELLO_STATUS = jmespath.compile(
+    "links[].connectors[?type=='zello-channel-api'][].[name, last_error.code]")
+
+# Error codes that indicate the connector lost its connection and needs a
+# fresh token. A frozenset gives O(1) membership checks as the list grows.
+_ERROR_CODES = frozenset((3001, 3002))
+
+# The JWT header never changes, so its base64url form is a constant.
+_JWT_HEADER_B64 = base64.urlsafe_b64encode(b'{"typ":"JWT","alg":"RS256"}').rstrip(b'=')
+
+# Caches for the parsed private keys and issuer IDs, keyed by file path.
+# Each entry stores the file's modification time alongside the loaded value,
+# so the expensive PEM parsing and file reads only happen again if the
+# file on disk actually changed.
+_key_cache = {}
+_issuer_cache = {}
+
+
+def _load_private_key(private_key_path):
+    """
+    Loads and caches the RSA private key from the given PEM file.
+
+    The parsed key object is reused across calls as long as the file's
+    modification time is unchanged, avoiding a fresh PEM parse per token.
+
+    Args:
+        private_key_path (str): The file path to the private key.
+
+    Returns:
+        The parsed private key object.
+    """
+    mtime = os.stat(private_key_path).st_mtime
+    cached = _key_cache.get(private_key_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(private_key_path, "rb") as key_file:
+        private_key = serialization.load_pem_private_key(
+            key_file.read(),
+            password=None
+        )
+    _key_cache[private_key_path] = (mtime, private_key)
+    return private_key
+
+
+def _load_issuer(issuer_path):
+    """
+    Loads and caches the issuer ID from the given text file.
+
+    Like _load_private_key, the cached value is reused until the file's
+    modification time changes.
+
+    Args:
+        issuer_path (str): The file path to the issuer ID.
+
+    Returns:
+        str: The issuer ID.
+    """
+    mtime = os.stat(issuer_path).st_mtime
+    cached = _issuer_cache.get(issuer_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(issuer_path, "r") as issuer_file:
+        issuer_content = issuer_file.read().strip()
+    _issuer_cache[issuer_path] = (mtime, issuer_content)
+    return issuer_content
+
+
+@lru_cache(maxsize=128)
+def _connector_paths(base_dir, username):
+    """
+    Builds the (issuer_path, private_key_path) pair for a username. Cached
+    because the same usernames recur on every recovery cycle.
+
+    Args:
+        base_dir (str): The directory containing the key and issuer files.
+        username (str): The connector's username.
+
+    Returns:
+        tuple: The issuer file path and the private key file path.
+    """
+    return (os.path.join(base_dir, f"{username}.txt"),
+            os.path.join(base_dir, f"{username}.pem"))
+
+
+def generate_jwt_token(issuer_path, private_key_path):
+    """
+    Generates a secure JWT token.
+    
+    This function reads a private key and an issuer ID from specified files,
+    creates a JWT payload, and signs the token using the RS256 algorithm.
+    
+    Args:
+        issuer_path (str): The file path to the issuer ID.
+        private_key_path (str): The file path to the private key used for signing.
+
+    Returns:
+        str: A newly generated JWT token, or None if a required file is missing
+             or if an error occurs during token creation.
+    """
+    # Safely read the content of the private key and issuer files. A missing
+    # file simply raises, so no separate existence checks are needed.
+    try:
+        # Load the private key (cached across calls) for use in signing.
+        private_key = _load_private_key(private_key_path)
+
+        # Read the issuer ID, which is a simple string in a text file.
+        issuer_content = _load_issuer(issuer_path)
+    except FileNotFoundError as e:
+        log.error("Key or issuer file not found at '%s'", e.filename)
+        return None
+    except OSError as e:
+        log.error("Failed to read key or issuer file: %s", e)
+        return None
+    except (ValueError, TypeError) as e:
+        log.error("Failed to parse the private key: %s", e)
+        return None
+    
+    # Define the JWT payload as per the required specification; the header
+    # is constant and already encoded in _JWT_HEADER_B64.
+    payload = orjson.dumps({
+        "iss": issuer_content,
+        "exp": time.time_ns() // 1_000_000_000 + 120 #New token is valid for 2 minutes
+    })
+
+    # Sign the token using the private key and the RS256 algorithm.
+    try:
+        payload_b64 = base64.urlsafe_b64encode(payload).rstrip(b'=')
+        signing_input = _JWT_HEADER_B64 + b'.' + payload_b64
+        signature = private_key.sign(signing_input, padding.PKCS1v15(), hashes.SHA256())
+        token = signing_input + b'.' + base64.urlsafe_b64encode(signature).rstrip(b'=')
+        log.info("Successfully generated a new token.")
+        return token.decode()
+    except (ValueError, TypeError) as e:
+        log.error("An error occurred while generating the JWT: %s", e)
+        return None
+
+def _patch_tokens_in_place(file_path, replacements):
+    """
+    Replaces old token strings with new ones directly in the raw file bytes.
+
+    This avoids re-serializing the whole configuration when only the token
+    values changed. Each replacement is only applied if the old token occurs
+    exactly once in the file, so the patch cannot touch unrelated data.
+
+    Args:
+        file_path (str): The path to the JSON configuration file.
+        replacements (list): A list of (old_token, new_token) string pairs.
+
+    Returns:
+        bool: True if all tokens were patched, False if the file needs a
+              full parse-and-rewrite instead.
+    """
+    with open(file_path, 'r+b') as f:
+        with mmap.mmap(f.fileno(), 0) as mm:
+            # Locate every old token and verify it is unique in the file
+            # before changing anything.
+            spans = []
+            for old_token, new_token in replacements:
+                old_bytes = b'"' + old_token.encode() + b'"'
+                start = mm.find(old_bytes)
+                if start == -1 or mm.find(old_bytes, start + 1) != -1:
+                    return False
+                spans.append((start, old_bytes, b'"' + new_token.encode() + b'"'))
+
+            if all(len(old) == len(new) for _, old, new in spans):
+                # Same-length tokens are spliced straight into the mapped
+                # file, so only the dirty bytes are ever written.
+                for start, old_bytes, new_bytes in spans:
+                    mm[start:start + len(new_bytes)] = new_bytes
+                mm.flush()
+                return True
+
+            # A token changed length; rebuild the buffer and rewrite.
+            raw = mm[:]
+
+    for _, old_bytes, new_bytes in spans:
+        raw = raw.replace(old_bytes, new_bytes)
+
+    with open(file_path, 'wb') as f:
+        f.write(raw)
+    return True
+
+
+def _rewrite_config(file_path, new_tokens):
+    """
+    Fully re-parses the configuration file and writes it back with the new
+    tokens assigned. Used as a fallback when in-place patching is not safe,
+    for example when a connector had no previous token to replace.
+
+    Args:
+        file_path (str): The path to the JSON configuration file.
+        new_tokens (dict): A mapping of username to freshly generated token.
+    """
+    with open(file_path, 'rb') as f:
+        data = orjson.loads(f.read())
+
+    # The selector returns references into 'data', so assigning through the
+    # matched connectors updates the document before it is written back.
+    for connector in _ZELLO_CONNECTORS.search(data) or []:
+        token = new_tokens.get(connector.get('username'))
+        if token:
+            connector['token'] = token
+
+    with open(file_path, 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+
+def update_connector_tokens(file_path):
+    """
+    This is the main function that reads the configuration file, finds the
+    relevant connectors, and updates their tokens.
+
+    The file is scanned with a streaming parser, so only the matching
+    connectors are kept in memory rather than the whole document. When every
+    connector already has a token, the new tokens are patched into the file
+    in place; otherwise the file is re-parsed and rewritten as a whole.
+
+    Args:
+        file_path (str): The path to the JSON configuration file to process.
+    """
+    # The base directory is used to locate the key and issuer files.
+    base_dir = os.path.dirname(file_path)
+
+    # Stream the file and collect only the connectors we care about. Opening
+    # the file directly avoids a separate existence check and stat call.
+    try:
+        with open(file_path, 'rb') as f:
+            connectors = [c for c in ijson.items(f, 'links.item.connectors.item')
+                          if isinstance(c, dict) and c.get('type') == 'zello-channel-api']
+    except FileNotFoundError:
+        log.error("The file '%s' was not found.", file_path)
+        return
+    except (ijson.JSONError, IOError) as e:
+        log.error("Error reading the file: %s", e)
+        return
+
+    if not connectors:
+        log.error("No 'zello-channel-api' connectors were found. Check for a top-level 'links' key.")
+        return
+
+    # Collect the issuer and private key file paths for each unique username.
+    work = {}
+    for connector in connectors:
+        username = connector.get('username')
+        if username and username not in work:
+            work[username] = _connector_paths(base_dir, username)
+
+    # Generate one token per username. RSA signing releases the GIL inside
+    # cryptography's C code, so tokens for multiple usernames are generated
+    # in parallel on a thread pool.
+    new_tokens = {}
+    if work:
+        with ThreadPoolExecutor(max_workers=min(len(work), os.cpu_count() or 1)) as executor:
+            results = executor.map(lambda paths: generate_jwt_token(*paths), work.values())
+            new_tokens = dict(zip(work.keys(), results))
+
+    # Pair each connector with its new token and remember which old token it
+    # currently holds, so the file can be patched in place.
+    replacements = []
+    patchable = True
+
+    for connector in connectors:
+        username = connector.get('username')
+        if not username:
+            log.warning("Found 'zello-channel-api' connector without a 'username'. Skipping.")
+            continue
+
+        new_token = new_tokens[username]
+        if new_token:
+            log.info("Successfully generated and assigned token for connector: %s", connector.get('name', 'N/A'))
+            old_token = connector.get('token')
+            if isinstance(old_token, str) and old_token:
+                replacements.append((old_token, new_token))
+            else:
+                # Without an old token there is nothing to patch over.
+                patchable = False
+        else:
+            log.error("Could not generate a token for connector: %s", connector.get('name', 'N/A'))
+
+    # Drop usernames whose token generation failed.
+    new_tokens = {username: token for username, token in new_tokens.items() if token}
+
+    if not new_tokens:
+        log.info("No tokens were generated. The file was not modified.")
+        return
+
+    # Save the new tokens back to the file, patching in place when possible.
+    try:
+        if not (patchable and _patch_tokens_in_place(file_path, replacements)):
+            _rewrite_config(file_path, new_tokens)
+        log.info("Successfully updated tokens and saved the file: %s", file_path)
+    except (OSError, ValueError) as e:
+        log.error("An error occurred while writing to the file: %s", e)
+        log.error("Please check file permissions and try again.")
+
+
+async def main():
+    # Use a while loop to run the script indefinitely
+
+    # Create an aiohttp session for connection pooling. The connector keeps
+    # sockets alive between polls so the bridge is not reconnected every poll;
+    # the 75-second keep-alive (matching the common server-side default)
+    # outlives the 30-second post-restart sleep, so even the first poll after
+    # a restart reuses the existing connection.
+    connector = aiohttp.TCPConnector(limit=8, keepalive_timeout=75,
+                                     enable_cleanup_closed=True)
+    timeout = aiohttp.ClientTimeout(total=5)
+
+    # Advertise keep-alive explicitly so the bridge holds the connection
+    # open between the 1-second polls instead of tearing it down.
+    headers = {'Connection': 'keep-alive'}
+
+    # Raw bytes of the last healthy /status body. When the body is identical
+    # to the previous poll there is nothing new to parse or walk.
+    last_body = None
+
+    # ETag of the last healthy /status response, if the bridge provides one.
+    # Sending it back as If-None-Match lets a supporting server answer 304
+    # without transferring (or us parsing) the body at all.
+    last_etag = None
+
+    # Seconds to wait between polls. The interval backs off while the bridge
+    # is healthy and unchanged, and snaps back to 1 second on any change or
+    # error so detection latency stays bounded.
+    interval = 1.0
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                     headers=headers) as session:
+        while True:
+            try:
+                # Send a GET request to the URL, conditional on the last seen
+                # ETag when one is known.
+                request_headers = {'If-None-Match': last_etag} if last_etag else None
+                async with session.get(url_endpoint+'/status',
+                                       headers=request_headers) as response:
+
+                    if response.status == 304:
+                        # The bridge confirmed the state is unchanged without
+                        # sending a body; let the polling interval grow.
+                        data = None
+                        interval = min(interval * 1.5, 5.0)
+                    # Check if the request was successful (status code 200)
+                    elif response.status == 200:
+                        etag = response.headers.get('ETag')
+                        body = await response.read()
+                        if body == last_body:
+                            # The bridge state is unchanged since the last
+                            # poll, so skip the JSON parse and connector walk
+                            # and let the polling interval grow.
+                            data = None
+                            interval = min(interval * 1.5, 5.0)
+                        else:
+                            # The response is in JSON format, so we can parse it directly
+                            data = orjson.loads(body)
+                    else:
+                        # If the status code is not 200, log it along with the
+                        # start of the body. Decoding is capped at 512 bytes so
+                        # a failing bridge cannot flood the log (or burn CPU)
+                        # with large error pages every poll.
+                        body = (await response.read())[:512].decode('utf-8', 'replace')
+                        log.error("Request failed with status code %s: %s", response.status, body)
+                        data = None
+                        interval = 1.0
+
+                if data is not None:
+                    config_path = data.get("config_file")
+
+                    # --- Functionality to check for specific error code ---
+                    found_error = False
+
+                    # The compiled selector pulls out each connector's name
+                    # and last_error code in one validated pass, instead of a
+                    # nested Python walk full of dict lookups.
+                    for name, error_code in _ZELLO_STATUS.search(data) or []:
+                        if log.isEnabledFor(logging.INFO):
+                            log.info("Connector '%s' error code is %s.", name or 'N/A', error_code)
+
+                        # Check if the error code is one that needs a new token
+                        if error_code in _ERROR_CODES:
+                            found_error = True
+
+                    if found_error:
+                        log.info("Connection error found. Generating new tokens...")
+                        update_connector_tokens(config_path)
+
+                        log.info("Restarting ZelloBridge")
+                        try:
+                            # Send a PUT request to the restart endpoint
+                            async with session.put(url_endpoint+'/restart') as restart_response:
+                                log.info("Restart request sent. Status code: %s", restart_response.status)
+                        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                            log.error("Failed to send restart request: %s", e)
+
+                        # Force a full fetch and parse on the next poll in
+                        # case the bridge comes back with an identical error
+                        # body (or an ETag matching it).
+                        last_body = None
+                        last_etag = None
+
+                        # Give the Bridge time to initialize, then verify the
+                        # restart with closely spaced polls.
+                        log.info("Sleep for 30 seconds\n")
+                        await asyncio.sleep(30)
+                        interval = 1.0
+                    else:
+                        # Healthy body; remember it (and its ETag) so
+                        # identical polls can be skipped until the state
+                        # changes. The state just changed, so poll closely
+                        # again for a while.
+                        last_body = body
+                        last_etag = etag
+                        interval = 1.0
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                # This block handles any errors that might occur during the request,
+                # such as a connection timeout or the server being down.
+                log.error("An error occurred: %s", e)
+                interval = 1.0
+
+            # Wait before the next iteration
+            await asyncio.sleep(interval)
+
+
+# This is the entry point of the script, which runs the async main function.
+if __name__ == '__main__':
+    asyncio.run(main())
+